@@ -19,10 +19,14 @@
 from collections import Counter
 from collections import defaultdict
 from collections import deque
+import asyncio
+import bisect
 import functools
+import heapq
 import itertools
 import operator
 import queue
+import time
 import uuid
 
 from proclets.proclet import Proclet
@@ -42,11 +46,49 @@ class Channel:
     independently access the channel; to do that, pass `this` to the `party` parameter
     of the channel method.
 
+    :param maxlen:      If supplied, the maximum number of messages stored for each recipient.
+    :param priority:    If supplied, maps message actions (or their enum classes) to a numerical rank.
+                        Messages are then delivered in order of rank, smaller values first.
+                        Messages of equal rank are delivered by earliest `deadline`.
+    :param clock:       A function returning the current time in nanoseconds.
+                        Messages whose `deadline` has passed are discarded when read.
+                        Defaults to `time.monotonic_ns`.
+    :param capacity:    If supplied, the maximum number of unread messages for each recipient.
+                        Messages to a full inbox are refused, rather than dropped.
+                        The number of refusals is counted by recipient in `blocked`.
+    :param compaction:  If supplied, each inbox is compacted after this many deliveries to it.
+                        See :meth:`~proclets.channel.Channel.compact`.
+    :param archive:     If False, compacted messages are discarded rather than archived.
+                        Memory use is then bounded by the unread messages.
+    :type maxlen:       int
+    :type priority:     dict
+    :type clock:        callable
+    :type capacity:     int
+    :type compaction:   int
+    :type archive:      bool
 
     """
-    def __init__(self, maxlen=None):
+    def __init__(
+        self, maxlen=None, priority=None, clock=None, capacity=None,
+        compaction=None, archive=True
+    ):
+        self.priority = priority
+        self.capacity = capacity
+        self.compaction = compaction
+        self.archive = defaultdict(list) if archive else None
+        self.blocked = Counter()
+        self.reserved = Counter()
+        self.freed = None
+        self.clock = clock or time.monotonic_ns
         self.store = defaultdict(functools.partial(deque, maxlen=maxlen))
         self.ready = defaultdict(Counter)
+        self.count = Counter()
+        self.index = defaultdict(functools.partial(defaultdict, list))
+        self.indexed = set()
+        self.taken = defaultdict(functools.partial(defaultdict, set))
+        self.heaps = defaultdict(functools.partial(defaultdict, list))
+        self.seen = defaultdict(dict)
+        self.latest = defaultdict(dict)
 
     def qsize(self, uid: uuid.UUID, party=None) -> int:
         """
@@ -55,7 +97,7 @@ class Channel:
         """
         if party not in self.ready[uid]:
             self.ready[uid][party] = len(self.store[uid])
-        return self.ready[uid][party]
+        return self.ready[uid][party] - len(self.taken[uid].get(party, ()))
 
     def empty(self, uid: uuid.UUID, party=None) -> bool:
         """
@@ -64,29 +106,254 @@ class Channel:
         """
         return self.qsize(uid, party=party) == 0
 
-    def full(self, uid: uuid.UUID, party=None):
-        return False
+    @staticmethod
+    def live(party) -> bool:
+        """
+        Return True if `party` may still read from the Channel.
+        A party which is a Proclet transition is live only while the Proclet marking enables it.
+
+        """
+        p = getattr(party, "__self__", None)
+        if isinstance(p, Proclet):
+            return p.i_nodes[party].issubset(p.marking)
+        return True
+
+    def backlog(self, uid: uuid.UUID) -> int:
+        """
+        Return the number of messages for `uid` still to be read by its :meth:`live` parties.
+        Before any party has read, every stored message counts.
+
+        """
+        ready = self.ready.get(uid)
+        if not ready:
+            return len(self.store.get(uid, ()))
+
+        return max(
+            (n - len(self.taken[uid].get(k, ())) for k, n in ready.items() if self.live(k)),
+            default=0
+        )
+
+    def full(self, uid: uuid.UUID, party=None) -> bool:
+        """
+        Return True if the inbox for `uid` is at capacity, False otherwise.
+
+        When `party` is not supplied, capacity is judged by the :meth:`backlog` of the inbox.
+
+        """
+        if self.capacity is None:
+            return False
+        elif party is not None:
+            return self.qsize(uid, party) >= self.capacity
+        else:
+            return self.backlog(uid) + self.reserved[uid] >= self.capacity
 
     def put(self, item: Performative):
+        """
+        Deliver a message to every recipient in its `group`.
+
+        Returns the number of deliveries made. If any recipient's inbox is full,
+        the message is not delivered at all, and the return value is zero.
+
+        """
         n = 0
         if not item.group:
             return
 
+        if self.capacity is not None:
+            full = [uid for uid in item.group if self.full(uid)]
+            if full:
+                self.blocked.update(full)
+                return n
+
         for uid in item.group:
-            for party in self.ready[uid] or [None]:
+            for party in self.ready.get(uid, ()):
                 self.ready[uid][party] += 1
-            self.store[uid].append(item)
+            inbox = self.store[uid]
+            if self.indexed:
+                if len(inbox) == inbox.maxlen:
+                    self.drop_index(uid, self.count[uid] - len(inbox), inbox[0])
+                self.add_index(uid, self.count[uid], item)
+            inbox.append(item)
+            self.count[uid] += 1
             n += 1
+            if self.compaction and not self.count[uid] % self.compaction:
+                self.compact(uid)
+
+        for uid in itertools.chain([item.sender], item.group):
+            self.latest[uid][(item.connect, item.action)] = item
         return n
 
+    async def aput(self, item: Performative):
+        """
+        An awaitable version of :meth:`~proclets.channel.Channel.put`.
+        It waits until every recipient has room for the message,
+        trying again each time a message is read from the Channel.
+
+        """
+        if self.freed is None:
+            self.freed = asyncio.Event()
+
+        while (rv := self.put(item)) == 0:
+            self.freed.clear()
+            await self.freed.wait()
+        return rv
+
     def get(self, uid: uuid.UUID, party=None):
-        if self.empty(uid, party=party):
+        item = self.pop(uid, party) if self.priority is not None else self.shift(uid, party)
+        if item is None:
             raise queue.Empty
-
-        item = self.store[uid][-self.ready[uid][party]]
-        self.ready[uid][party] -= 1
         return item
 
+    def shift(self, uid: uuid.UUID, party=None):
+        """
+        Return the oldest unexpired message for `uid`, or None if there is none.
+
+        """
+        rv = self.peek(uid, party)
+        if rv is not None:
+            self.take(uid, party, rv[0])
+            return rv[1]
+
+    def pop(self, uid: uuid.UUID, party=None):
+        """
+        Return the unexpired message for `uid` which has the highest priority,
+        or None if there is none.
+
+        Messages are ranked by the priority of their action, then by deadline,
+        then by order of arrival.
+
+        """
+        rv = self.peek(uid, party)
+        if rv is not None:
+            heapq.heappop(self.heaps[uid][party])
+            self.take(uid, party, rv[0])
+            return rv[1]
+
+    def peek(self, uid: uuid.UUID, party=None) -> tuple:
+        """
+        Find the next message for `uid` without delivering it.
+        Expired messages are discarded along the way.
+
+        Returns a tuple of the message sequence number and the message itself,
+        or None if there is none.
+        Pass the sequence number to :meth:`~proclets.channel.Channel.take` to deliver it.
+
+        """
+        self.qsize(uid, party)
+        taken = self.taken[uid][party]
+        inbox = self.store[uid]
+        now = None
+        if self.priority is None:
+            while not self.empty(uid, party=party):
+                n = min(self.ready[uid][party], len(inbox))
+                while taken and self.count[uid] - n in taken:
+                    taken.discard(self.count[uid] - n)
+                    n -= 1
+
+                self.ready[uid][party] = n
+                if not n:
+                    break
+
+                item = inbox[-n]
+                if item.deadline is None or item.deadline >= (now or (now := self.clock())):
+                    return self.count[uid] - n, item
+                self.ready[uid][party] = n - 1
+            return None
+
+        heap = self.heaps[uid][party]
+        offset = self.count[uid] - len(inbox)
+        start = self.count[uid] - self.ready[uid][party]
+        for seq in range(max(self.seen[uid].get(party, start), start, offset), self.count[uid]):
+            item = inbox[seq - offset]
+            rank = self.priority.get(item.action, self.priority.get(type(item.action), float("inf")))
+            heapq.heappush(heap, (rank, float("inf") if item.deadline is None else item.deadline, seq))
+        self.seen[uid][party] = self.count[uid]
+
+        while heap:
+            rank, deadline, seq = heap[0]
+            start = self.count[uid] - self.ready[uid][party]
+            if seq < max(start, offset) or seq in taken:
+                heapq.heappop(heap)
+            elif deadline < (now or (now := self.clock())):
+                heapq.heappop(heap)
+                self.take(uid, party, seq)
+            else:
+                return seq, inbox[seq - offset]
+
+    def take(self, uid: uuid.UUID, party, seq: int):
+        """
+        Mark the message with sequence number `seq` as delivered out of order.
+
+        """
+        taken = self.taken[uid][party]
+        taken.add(seq)
+        n = self.ready[uid][party]
+        while n and self.count[uid] - n in taken:
+            taken.discard(self.count[uid] - n)
+            n -= 1
+        self.ready[uid][party] = n
+        if self.freed is not None:
+            self.freed.set()
+
+    def index_keys(self, item: Performative):
+        for field in self.indexed:
+            if field == "context":
+                for i in item.context or ():
+                    yield (field, i)
+            else:
+                yield (field, getattr(item, field))
+
+    def add_index(self, uid: uuid.UUID, seq: int, item: Performative):
+        for key in self.index_keys(item):
+            self.index[uid][key].append(seq)
+
+    def drop_index(self, uid: uuid.UUID, seq: int, item: Performative):
+        """
+        Remove the message with sequence number `seq` from the indexes, when it leaves the inbox.
+
+        """
+        index = self.index[uid]
+        for key in self.index_keys(item):
+            seqs = index.get(key)
+            if seqs and seqs[0] == seq:
+                del seqs[0]
+            if not seqs:
+                index.pop(key, None)
+
+    def select(self, uid: uuid.UUID, party=None, **kwargs):
+        """
+        Yield undelivered messages for `uid` which match every one of the keyword arguments.
+        Those which do not match remain undelivered.
+
+        Keyword arguments may be `action`, `sender`, `connect` or `context`.
+        For `context`, a message matches if it contains the value supplied.
+
+        """
+        for field in kwargs.keys() - self.indexed:
+            self.indexed.add(field)
+            for u, items in self.store.items():
+                for n, item in enumerate(items, start=self.count[u] - len(items)):
+                    self.add_index(u, n, item)
+
+        self.qsize(uid, party)
+        seqs = min((self.index[uid].get(i, []) for i in kwargs.items()), key=len)
+        taken = self.taken[uid][party]
+        start = self.count[uid] - self.ready[uid][party]
+        for seq in seqs[bisect.bisect_left(seqs, start):]:
+            start = self.count[uid] - self.ready[uid][party]
+            offset = self.count[uid] - len(self.store[uid])
+            if seq < max(start, offset) or seq in taken:
+                continue
+
+            item = self.store[uid][seq - offset]
+            if all(
+                v in (item.context or ()) if k == "context" else getattr(item, k) == v
+                for k, v in kwargs.items()
+            ):
+                self.take(uid, party, seq)
+                if item.deadline is None or item.deadline >= self.clock():
+                    yield item
+
     def send(self, **kwargs):
         """
         Submit a message for delivery.
@@ -98,6 +365,10 @@ class Channel:
 
         All keyword arguments are those of a Performative_.
 
+        Nothing is yielded if the message could not be delivered because the
+        Channel is :meth:`~proclets.channel.Channel.full`.
+        A transition may then choose not to yield `None`, so that its marking is unchanged.
+
         """
         kwargs["channel"] = kwargs.get("channel", self)
         msg = Performative(**kwargs)
@@ -106,19 +377,41 @@ class Channel:
         for i in range(sent or 0):
             yield msg
 
-    def receive(self, p: Proclet, party=None) -> Performative:
+    def receive(
+        self, p: Proclet, party=None,
+        action=None, sender=None, connect=None, context=None
+    ) -> Performative:
         """
         Yield all undelivered messages intended for the Proclet.
 
+        If any filter parameter is supplied, only matching messages are delivered.
+        The rest remain available to later calls.
+
+        :param action:  Deliver only messages with this `action`.
+        :param sender:  Deliver only messages from this `sender`.
+        :param connect: Deliver only messages with this `connect` id.
+        :param context: Deliver only messages whose `context` contains this value.
+
         """
-        while not self.empty(p.uid, party):
-            yield self.get(p.uid, party)
+        filters = {
+            k: v for k, v in (
+                ("action", action), ("sender", sender), ("connect", connect), ("context", context)
+            ) if v is not None
+        }
+        if filters:
+            yield from self.select(p.uid, party, **filters)
+            return
+
+        get = self.pop if self.priority is not None else self.shift
+        while (item := get(p.uid, party)) is not None:
+            yield item
 
     def reply(self, p: Proclet, m: Performative, **kwargs) -> Performative:
         """
         Proclet `p` having received a message `m`; use it to craft a reply to its sender.
         This method preserves `context` and `connection` of messages.
         Keyword arguments are those of a Performative_.
+        Returns None if the reply could not be delivered.
 
         """
         msg = Performative(**dict(
@@ -137,6 +430,9 @@ class Channel:
         Process undelivered messages for `p` as a batch.
         Yields each generated reply as a Performative_.
 
+        A message which needs a reply is left unread while the inbox of its sender is
+        :meth:`~proclets.channel.Channel.full`. Processing stops there.
+
         :param actions:     Maps incoming message actions to a corresponding action in the generated reply.
         :param contents:    Maps incoming message actions to corresponding content in the generated reply.
         :param context:     If supplied, add extra context to the reply.
@@ -147,14 +443,28 @@ class Channel:
         :type senders:      set
 
         """
-        while not self.empty(p.uid, party):
-            m = self.get(p.uid, party)
-            yield m
+        while (rv := self.peek(p.uid, party)) is not None:
+            seq, m = rv
             action = actions and actions.get(m.action)
+            senders = senders or {m.sender}
+            replying = action is not None and m.sender in senders
+            if replying and self.full(m.sender):
+                # Leave the message unread until there is room for the reply
+                self.blocked[m.sender] += 1
+                return
+
+            if self.priority is not None:
+                heapq.heappop(self.heaps[p.uid][party])
+            self.take(p.uid, party, seq)
+            self.reserved[m.sender] += replying
+            try:
+                yield m
+            finally:
+                self.reserved[m.sender] -= replying
+
             content = contents and contents.get(m.action)
             context = m.context and m.context.copy().union(context or set())
-            senders = senders or {m.sender}
-            if action is not None and m.sender in senders:
+            if replying:
                 yield from self.send(
                     sender=p.uid, group={m.sender},
                     action=action, content=content,
@@ -162,6 +472,61 @@ class Channel:
                     context=context
                 )
 
+    def compact(self, uid: uuid.UUID = None) -> int:
+        """
+        Free the messages in an inbox which have been read by every party.
+        If `uid` is not supplied, every inbox is compacted.
+
+        Unless the Channel was created with `archive=False`, the messages
+        are kept in `archive` by their `connect` id, so they remain available to
+        :meth:`~proclets.channel.Channel.view`.
+        A party which first reads after compaction sees only the messages which remain.
+
+        Returns the number of messages freed.
+
+        """
+        rv = 0
+        for u in [uid] if uid is not None else list(self.store):
+            if not self.ready.get(u):
+                continue
+
+            inbox = self.store[u]
+            offset = self.count[u] - len(inbox)
+            n = len(inbox) - max(self.ready[u].values())
+            for i in range(n):
+                m = inbox.popleft()
+                if self.archive is not None and m not in self.archive[m.connect]:
+                    self.archive[m.connect].append(m)
+
+            offset += n
+            for k, seqs in list(self.index[u].items()):
+                del seqs[:bisect.bisect_left(seqs, offset)]
+                if not seqs:
+                    del self.index[u][k]
+            rv += n
+        return rv
+
+    def last(self, uid: uuid.UUID, action=None) -> list:
+        """
+        Return the most recent message of each conversation in which the Proclet with `uid`
+        took part, in the order they were generated.
+        If `action` is supplied, return the most recent message with that action instead.
+
+        This is maintained as messages are delivered, so the cost does not grow with the history
+        of the Channel.
+
+        """
+        latest = self.latest.get(uid, {})
+        if action is not None:
+            msgs = [m for (connect, a), m in latest.items() if a == action]
+        else:
+            msgs = {}
+            for (connect, a), m in latest.items():
+                if connect not in msgs or msgs[connect].ts < m.ts:
+                    msgs[connect] = m
+            msgs = list(msgs.values())
+        return sorted(msgs, key=operator.attrgetter("ts"))
+
     def view(self, uid: uuid.UUID):
         """
         Scan the entire Channel for messages sent and received by the Proclet with `uid`.
@@ -171,10 +536,16 @@ class Channel:
         they were generated.
 
         """
-        msgs = sorted(itertools.chain.from_iterable(self.store.values()), key=operator.attrgetter("ts"))
+        msgs = {
+            m.uid: m
+            for m in itertools.chain.from_iterable(
+                itertools.chain(self.archive.values(), self.store.values())
+                if self.archive else self.store.values()
+            )
+            if m.sender == uid or uid in m.group
+        }
         rv = defaultdict(list)
-        for m in msgs:
-            if m.sender == uid or uid in m.group:
-                rv[m.connect].append(m)
+        for m in sorted(msgs.values(), key=operator.attrgetter("ts")):
+            rv[m.connect].append(m)
         return rv
 
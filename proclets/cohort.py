@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+#   encoding: utf-8
+
+# This file is part of proclets.
+#
+# Proclets is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Proclets is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with proclets.  If not, see <http://www.gnu.org/licenses/>.
+
+from array import array
+from collections import defaultdict
+from collections.abc import MutableMapping
+from collections.abc import Set
+
+from proclets.net import Net
+from proclets.proclet import Proclet
+
+
+class Column(MutableMapping):
+    """
+    A Counter-like view of one member's entries in a table of columns.
+
+    """
+    def __init__(self, table, n):
+        self.table = table
+        self.n = n
+
+    def __getitem__(self, key):
+        try:
+            return self.table[key][self.n]
+        except KeyError:
+            return 0
+
+    def __setitem__(self, key, value):
+        self.table[key][self.n] = value
+
+    def __delitem__(self, key):
+        self.table[key][self.n] = 0
+
+    def __iter__(self):
+        return (k for k, v in self.table.items() if v[self.n])
+
+    def __len__(self):
+        return sum(1 for i in self)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)})"
+
+
+class Marking(Set):
+    """
+    A set-like view of one member's marking, which the Cohort stores as a bit mask.
+
+    """
+    def __init__(self, cohort, n):
+        self.cohort = cohort
+        self.n = n
+
+    def __contains__(self, place):
+        return bool(self.cohort.marking[self.n] & self.cohort.net.bits.get(place, 0))
+
+    def __iter__(self):
+        return iter(self.cohort.net.decode(self.cohort.marking[self.n]))
+
+    def __len__(self):
+        return bin(self.cohort.marking[self.n]).count("1")
+
+    def __repr__(self):
+        return f"{type(self).__name__}({set(self)})"
+
+
+class Cohort:
+    """
+    A Cohort runs many Proclets of the same class which differ only in their state.
+
+    The marking of each member is stored as a bit mask, and its `tally` and `slate`
+    in columns of integers, one per transition.
+    Members which share a marking share the calculation of their enabled transitions.
+    The compiled :class:`~proclets.net.Net` remembers those results, so the work is done once
+    for each distinct marking.
+
+    Transitions are dispatched in batches. Members with the same enabled transitions, in the
+    same order of precedence, are grouped together. Each transition is fired in turn for
+    every member of the group.
+
+    Members keep their usual attributes, but `marking`, `tally` and `slate` become views
+    on to the state of the Cohort.
+
+    """
+
+    @classmethod
+    def create(cls, proclet: type, n: int, **kwargs):
+        """
+        Create `n` members of the class `proclet` and return them as a Cohort.
+        Keyword arguments are passed to :meth:`~proclets.proclet.Proclet.create`.
+
+        """
+        return cls(proclet.create(**kwargs) for i in range(n))
+
+    def __init__(self, members):
+        self.members = list(members)
+        proto = self.members[0]
+        self.proclet = type(proto)
+        if any(type(i) is not self.proclet for i in self.members):
+            raise TypeError(f"Cohort members must all be of type {self.proclet.__name__}")
+
+        self.net = Net.compile(proto)
+        self.names = self.net.names
+        self.parents = {n for n, i in enumerate(self.members) if i.domain}
+
+        masks = [self.net.encode(i.marking) for i in self.members]
+        self.marking = array("Q", masks) if len(self.net.places) <= 64 else masks
+        self.tally = {k: array("Q", (i.tally[k] for i in self.members)) for k in self.names}
+        self.slate = {k: array("Q", (i.slate[k] for i in self.members)) for k in self.names}
+
+        for n, p in enumerate(self.members):
+            p.marking = Marking(self, n)
+            p.tally = Column(self.tally, n)
+            p.slate = Column(self.slate, n)
+
+    def __len__(self):
+        return len(self.members)
+
+    @property
+    def groups(self):
+        """
+        This dictionary maps each distinct marking to the indexes of the members which hold it.
+
+        """
+        rv = defaultdict(list)
+        for n, m in enumerate(self.marking):
+            rv[m].append(n)
+        return rv
+
+    def __call__(self, **kwargs):
+        batches = defaultdict(list)
+        for marking, members in self.groups.items():
+            enabled = self.net.enabled(marking)
+            for n in members:
+                if len(enabled) > 1:
+                    order = tuple(sorted(enabled, key=lambda t: self.tally[self.names[t]][n]))
+                else:
+                    order = enabled
+                batches[order].append(n)
+
+        fired = set()
+        for order, members in batches.items():
+            for t in order:
+                for n in members:
+                    yield from self.fire(n, t, fired, **kwargs)
+
+        for n in sorted(self.parents):
+            for p in self.members[n].domain:
+                yield from p(**kwargs)
+
+    def fire(self, n: int, t: int, fired: set, **kwargs):
+        p = self.members[n]
+        name = self.names[t]
+        fn = getattr(p, name)
+        slate = 0 if n in fired else 1
+        for obj in fn(fn, **kwargs) or []:
+            p.trace.appendleft(name)
+
+            if obj is None:
+                self.marking[n] = self.net.fire(self.marking[n], t)
+                slate = self.slate[name][n] = 0
+                fired.add(n)
+            elif isinstance(obj, Proclet):
+                if obj not in p.domain:
+                    p.domain.append(obj)
+
+            yield obj
+
+        if p.domain:
+            self.parents.add(n)
+        self.slate[name][n] += slate
+        self.tally[name][n] += 1
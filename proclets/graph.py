@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+#   encoding: utf-8
+
+# This file is part of proclets.
+#
+# Proclets is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Proclets is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with proclets.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import Counter
+from collections import defaultdict
+from collections import deque
+import concurrent.futures
+import functools
+import itertools
+
+from proclets.net import Net
+
+
+def expand(pre: tuple, post: tuple, markings: list) -> list:
+    """
+    Return the successors of each marking in a batch. Runs in worker processes.
+
+    """
+    return [
+        [(t, m & ~i | o) for t, (i, o) in enumerate(zip(pre, post)) if m & i == i]
+        for m in markings
+    ]
+
+
+class Graph:
+    """
+    A Graph is the reachability graph of a compiled :class:`~proclets.net.Net`.
+
+    Markings are the bit masks of the Net. No transition code is executed.
+
+    Use :meth:`~proclets.graph.Graph.explore` to build one.
+
+    """
+
+    @classmethod
+    def explore(
+        cls, net: Net, marking: int = None,
+        depth_first=False, reduce=False, symmetries=None,
+        workers=None, batch=256, limit=None
+    ):
+        """
+        Enumerate the markings reachable from `marking` (by default the initial marking of the Net).
+
+        :param depth_first: Explore depth first. The default is breadth first.
+        :param reduce:      Apply partial order reduction. When an enabled transition shares no
+                            place with any other transition, only that transition is explored.
+                            The reduced graph has the same deadlocks, but fewer interleavings.
+        :param symmetries:  A sequence of dictionaries, each of which permutes places.
+                            Markings equivalent under a permutation are stored once,
+                            as the smallest of their images.
+        :param workers:     If supplied, expand the frontier in batches across this many processes.
+                            Exploration is then breadth first.
+        :param batch:       The number of markings in each batch sent to a worker process.
+        :param limit:       Stop after exploring this many markings.
+
+        """
+        rv = cls(net, net.initial if marking is None else marking)
+        canon = rv.canonical(symmetries) if symmetries else None
+        ample = rv.independent() if reduce else frozenset()
+        start = canon(rv.initial) if canon else rv.initial
+        frontier = deque([start])
+        seen = {start}
+
+        if workers:
+            pool = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+            func = functools.partial(expand, net.pre, net.post)
+        else:
+            pool = None
+
+        try:
+            while frontier and (limit is None or len(rv.edges) < limit):
+                if pool:
+                    todo = [frontier.popleft() for i in range(len(frontier))]
+                    results = zip(todo, itertools.chain.from_iterable(
+                        pool.map(func, [todo[i:i + batch] for i in range(0, len(todo), batch)])
+                    ))
+                else:
+                    m = frontier.pop() if depth_first else frontier.popleft()
+                    results = [(m, list(net.successors(m)))]
+
+                for m, succ in results:
+                    if canon:
+                        succ = [(t, canon(i)) for t, i in succ]
+                    if ample:
+                        # An ample transition must lead somewhere new, lest the others be ignored
+                        succ = next(([i] for i in succ if i[0] in ample and i[1] not in seen), succ)
+                    rv.edges[m] = tuple(succ)
+                    for t, i in succ:
+                        if i not in seen:
+                            seen.add(i)
+                            frontier.append(i)
+        finally:
+            if pool:
+                pool.shutdown()
+
+        return rv
+
+    def __init__(self, net: Net, initial: int):
+        self.net = net
+        self.initial = initial
+        self.edges = {}
+
+    def __len__(self):
+        return len(self.edges)
+
+    def __contains__(self, marking):
+        return marking in self.edges
+
+    def __iter__(self):
+        return iter(self.edges)
+
+    def independent(self) -> frozenset:
+        """
+        Return the indexes of transitions which share no place with any other.
+
+        """
+        touches = [i | o for i, o in zip(self.net.pre, self.net.post)]
+        return frozenset(
+            t for t, i in enumerate(touches)
+            if not any(i & j for n, j in enumerate(touches) if n != t)
+        )
+
+    def canonical(self, symmetries):
+        """
+        Return a function which maps a marking to its smallest image under `symmetries`.
+
+        """
+        bits = self.net.bits
+        perms = [
+            {bits[k]: bits[v] for k, v in i.items()}
+            for i in symmetries
+        ]
+
+        @functools.lru_cache(maxsize=None)
+        def canon(marking):
+            images = [marking]
+            for perm in perms:
+                images.append(sum(perm.get(b, b) for b in bits.values() if marking & b))
+            return min(images)
+
+        return canon
+
+    def successors(self, marking: int) -> tuple:
+        return self.edges.get(marking, ())
+
+    @functools.cached_property
+    def predecessors(self) -> dict:
+        """
+        This dictionary maps each marking to the transitions and markings which lead to it.
+
+        """
+        rv = defaultdict(list)
+        for m, succ in self.edges.items():
+            for t, i in succ:
+                rv[i].append((t, m))
+        return rv
+
+    @property
+    def deadlocks(self) -> list:
+        """
+        The markings which enable no transition.
+
+        """
+        return [m for m, succ in self.edges.items() if not succ]
+
+    def path(self, marking: int) -> list:
+        """
+        Return the shortest sequence of transition names which leads from the initial marking to
+        `marking`, or None if it is not reachable.
+
+        """
+        back = {self.initial: None}
+        frontier = deque([self.initial])
+        while frontier:
+            m = frontier.popleft()
+            if m == marking:
+                rv = []
+                while back[m] is not None:
+                    t, m = back[m]
+                    rv.append(self.net.names[t])
+                return rv[::-1]
+
+            for t, i in self.successors(m):
+                if i not in back:
+                    back[i] = (t, m)
+                    frontier.append(i)
+
+    def hot(self, n: int = None) -> list:
+        """
+        Return the markings reached by most arcs in the graph, with their counts.
+        The enabled transitions of each are calculated in advance and cached in the Net.
+
+        """
+        rv = Counter(i for succ in self.edges.values() for t, i in succ).most_common(n)
+        for m, count in rv:
+            self.net.enabled(m)
+        return rv
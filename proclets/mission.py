@@ -52,8 +52,7 @@ class Control(Proclet):
     def pro_separation(self, this, **kwargs):
         try:
             sync = next(
-                i for i in self.channels["uplink"].receive(self, this)
-                if i.action == this.__name__
+                self.channels["uplink"].receive(self, this, action=this.__name__)
             )
             logging.debug(sync, extra={"proclet": self})
         except StopIteration:
@@ -65,8 +64,7 @@ class Control(Proclet):
     def pro_reentry(self, this, **kwargs):
         try:
             sync = next(
-                i for i in self.channels["beacon"].receive(self, this)
-                if i.action == this.__name__
+                self.channels["beacon"].receive(self, this, action=this.__name__)
             )
         except StopIteration:
             yield
@@ -119,6 +117,7 @@ class Recovery(Proclet):
         self.target = target
         self.luck = random.triangular(0, 1, 3/4) if luck is None else luck
         self.duty = None
+        self.found = None
 
     @property
     def net(self):
@@ -144,23 +143,32 @@ class Recovery(Proclet):
     def pro_recovery(self, this, **kwargs):
         vehicle = self.population[next(iter(self.duty.context))].name.lower()
         logging.info(f"Commencing search for {vehicle}", extra={"proclet": self})
-        if random.random() < self.luck:
+        if self.found is None:
+            self.found = random.random() < self.luck
+
+        r = self.channels["vhf"].reply(
+            self, self.duty, action=Exit.deliver if self.found else Exit.abandon
+        )
+        if r is None:
+            return
+
+        if self.found:
             yield from self.channels["beacon"].send(
                 sender=self.uid, group=self.duty.context,
                 context=self.duty.context,
                 action=this.__name__,
             )
-            yield self.channels["vhf"].reply(self, self.duty, action=Exit.deliver)
+            yield r
             logging.info(f"Rendezvous with {vehicle}", extra={"proclet": self})
-            yield
         else:
-            yield self.channels["vhf"].reply(self, self.duty, action=Exit.abandon)
+            yield r
             logging.info(f"Abandoning search for {vehicle}", extra={"proclet": self})
-            yield
+        yield
 
     def pro_standby(self, this, **kwargs):
         logging.info(f"Team {self.uid.hex[:3]} standing by", extra={"proclet": self})
         self.duty = None
+        self.found = None
         yield
 
 
@@ -183,8 +191,7 @@ class Vehicle(Proclet):
     def pro_launch(self, this, **kwargs):
         try:
             sync = next(
-                i for i in self.channels["uplink"].receive(self, this)
-                if i.action == this.__name__
+                self.channels["uplink"].receive(self, this, action=this.__name__)
             )
             logging.debug(sync, extra={"proclet": self})
         except StopIteration:
@@ -228,8 +235,7 @@ class Vehicle(Proclet):
     def pro_recovery(self, this, **kwargs):
         try:
             sync = next(
-                i for i in self.channels["beacon"].receive(self, this)
-                if i.action == this.__name__
+                self.channels["beacon"].receive(self, this, action=this.__name__)
             )
             logging.debug(sync, extra={"proclet": self})
         except StopIteration:
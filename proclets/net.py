@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+#   encoding: utf-8
+
+# This file is part of proclets.
+#
+# Proclets is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Proclets is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with proclets.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import deque
+import warnings
+import weakref
+
+
+class Net:
+    """
+    A Net is the compiled form of the :attr:`~proclets.proclet.Proclet.net` of a Proclet class.
+
+    Places are numbered as they are in the Proclet. Each place is assigned a bit,
+    so that a marking may be encoded as a single integer.
+    The input and output places of each transition are then encoded likewise.
+    These bit masks are the rows of the *pre* and *post* incidence matrices.
+
+    Since a Proclet marking is a set, firing a transition is the bitwise operation::
+
+        marking & ~pre | post
+
+    Nets are compiled once for each Proclet class, on creation of the first instance.
+    The structure of the net is validated at that time.
+
+    """
+
+    cache = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def compile(cls, p):
+        """
+        Return the compiled Net of a Proclet's class.
+
+        """
+        try:
+            return cls.cache[type(p)]
+        except KeyError:
+            transitions = list(p.net)
+            rv = cls(
+                [i.__name__ for i in transitions],
+                [p.i_nodes[i] for i in transitions],
+                [p.o_nodes[i] for i in transitions],
+                marking={0},
+                label=type(p).__name__,
+            )
+            for name in rv.missing:
+                warnings.warn(f"No input place to {rv.label}.{name}")
+            for name in rv.unreachable:
+                warnings.warn(f"Transition {rv.label}.{name} can never be enabled")
+            cls.cache[type(p)] = rv
+            return rv
+
+    def __init__(self, names, i_nodes, o_nodes, marking=None, label=None):
+        self.names = tuple(names)
+        self.label = label or type(self).__name__
+        self.places = tuple(sorted(set(marking or ()).union(*i_nodes, *o_nodes)))
+        self.bits = {p: 1 << n for n, p in enumerate(self.places)}
+        self.pre = tuple(self.encode(i) for i in i_nodes)
+        self.post = tuple(self.encode(i) for i in o_nodes)
+        self.initial = self.encode(marking or ())
+        self.enabling = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    def encode(self, marking) -> int:
+        """
+        Return the bit mask for a marking given as a set of places.
+
+        """
+        rv = 0
+        for i in marking:
+            rv |= self.bits[i]
+        return rv
+
+    def decode(self, marking: int) -> set:
+        """
+        Return the set of places for a marking encoded as a bit mask.
+
+        """
+        return {p for p, b in self.bits.items() if marking & b}
+
+    def matrix(self, rows) -> list:
+        return [[1 if r & b else 0 for b in self.bits.values()] for r in rows]
+
+    @property
+    def pre_matrix(self) -> list:
+        """
+        The dense pre-incidence matrix; one row per transition, one column per place.
+
+        """
+        return self.matrix(self.pre)
+
+    @property
+    def post_matrix(self) -> list:
+        """
+        The dense post-incidence matrix; one row per transition, one column per place.
+
+        """
+        return self.matrix(self.post)
+
+    @property
+    def incidence(self) -> list:
+        """
+        The dense incidence matrix, being the post-incidence less the pre-incidence.
+
+        """
+        return [
+            [b - a for a, b in zip(i, o)]
+            for i, o in zip(self.pre_matrix, self.post_matrix)
+        ]
+
+    @property
+    def missing(self) -> list:
+        """
+        The names of transitions which have no input place.
+
+        """
+        return [n for n, i in zip(self.names, self.pre) if not i]
+
+    @property
+    def unreachable(self) -> list:
+        """
+        The names of transitions with an input place which is neither initially marked
+        nor an output of any transition.
+
+        """
+        produced = self.initial
+        for i in self.post:
+            produced |= i
+        return [n for n, i in zip(self.names, self.pre) if i & ~produced]
+
+    def enabled(self, marking: int) -> tuple:
+        """
+        Return the indexes of the transitions enabled by a marking.
+
+        """
+        try:
+            return self.enabling[marking]
+        except KeyError:
+            rv = self.enabling[marking] = tuple(
+                n for n, i in enumerate(self.pre) if marking & i == i
+            )
+            return rv
+
+    def fire(self, marking: int, t: int) -> int:
+        """
+        Return the marking which results from firing transition `t`.
+
+        """
+        return marking & ~self.pre[t] | self.post[t]
+
+    def successors(self, marking: int):
+        """
+        Generate a pair for each transition enabled by `marking`; the transition index and
+        the marking which results from firing it.
+
+        """
+        for t in self.enabled(marking):
+            yield t, self.fire(marking, t)
+
+    def reachable(self, marking: int = None, limit: int = None) -> dict:
+        """
+        Explore breadth-first from `marking` (by default the initial marking).
+
+        Returns a dictionary which maps each marking reached to a list of its successors.
+        If `limit` is supplied, exploration stops after that many markings.
+
+        """
+        marking = self.initial if marking is None else marking
+        rv = {}
+        frontier = deque([marking])
+        while frontier and (limit is None or len(rv) < limit):
+            m = frontier.popleft()
+            if m in rv:
+                continue
+
+            rv[m] = list(self.successors(m))
+            frontier.extend(i for t, i in rv[m] if i not in rv)
+        return rv
+
+    def dead(self, marking: int = None) -> list:
+        """
+        The names of transitions which are never enabled in any reachable marking.
+
+        """
+        live = {t for v in self.reachable(marking).values() for t, m in v}
+        return [n for t, n in enumerate(self.names) if t not in live]
+
+    def unsafe(self, marking: int = None) -> list:
+        """
+        Find where firing a transition would put a token into a place already marked.
+        A Proclet marking is a set, so those tokens are merged.
+
+        Returns a list of pairs; the reachable marking and the index of the transition.
+
+        """
+        return [
+            (m, t)
+            for m in self.reachable(marking)
+            for t in self.enabled(m)
+            if m & ~self.pre[t] & self.post[t]
+        ]
+
+    def bounded(self, marking: int = None) -> bool:
+        """
+        True if the net is safe; no reachable firing merges tokens in a place.
+
+        """
+        return not self.unsafe(marking)
@@ -25,6 +25,10 @@ import uuid
 import warnings
 import weakref
 
+from proclets.net import Net
+from proclets.types import Summary
+from proclets.types import Termination
+
 
 class Proclet:
     """
@@ -108,6 +112,9 @@ class Proclet:
         :param trace:   This sequence stores the names of transitions fired, most recent first.
         :param priority:    A numerical value for relative priority of execution.
                             Smaller values have higher priority.
+        :param retain:  If False, child Proclets which are :attr:`~proclets.proclet.Proclet.done` are
+                        retired from the :attr:`~proclets.proclet.Proclet.domain`.
+                        A Summary_ of each is kept in :attr:`~proclets.proclet.Proclet.archive`.
 
         :type uid: uuid.UUID
         :type name: str
@@ -118,12 +125,14 @@ class Proclet:
         :type tally: Counter
         :type trace: deque
         :type priority: int
+        :type retain: bool
 
         """
         name = fmt.format(len(cls.population) + 1, cls=cls)
         kwargs["name"] = kwargs.get("name", name)
         kwargs["marking"] = kwargs.get("marking", set()).copy()
         rv = cls(*args, **kwargs)
+        Net.compile(rv)
         cls.population[rv.uid] = rv
         return rv
 
@@ -141,7 +150,7 @@ class Proclet:
         self, *args,
         uid=None, name=None, channels=None, group=None,
         marking=None, slate=None, tally=None, trace=None,
-        priority=None
+        priority=None, retain=True
     ):
         self.uid = uid or uuid.uuid4()
         self.name = name or self.uid
@@ -154,6 +163,8 @@ class Proclet:
         self.priority = priority
         self.arcs = dict(self.build_arcs(self.net))
         self.domain = []
+        self.retain = retain
+        self.archive = {}
 
     def __call__(self, **kwargs):
         procs = [
@@ -164,7 +175,15 @@ class Proclet:
             procs.sort(key=operator.itemgetter(0))
             priority, p = procs.pop(0)
             if p is not self:
-                yield from p(**kwargs)
+                try:
+                    yield from p(**kwargs)
+                except Termination:
+                    if self.retain:
+                        raise
+                    self.retire(p, terminated=True)
+                else:
+                    if not self.retain and p.done:
+                        self.retire(p)
             else:
                 n = 1
                 for fn in self.enabled:
@@ -190,6 +209,27 @@ class Proclet:
                     self.slate[fn.__name__] += n
                     self.tally[fn.__name__] += 1
 
+    def retire(self, p, terminated=False):
+        """
+        Remove a child Proclet from the :attr:`~proclets.proclet.Proclet.domain`.
+        A Summary_ of it is stored in the :attr:`~proclets.proclet.Proclet.archive` by its `uid`,
+        and returned.
+
+        """
+        self.domain.remove(p)
+        rv = self.archive[p.uid] = p.summary(terminated=terminated)
+        return rv
+
+    def summary(self, terminated=False):
+        """
+        Return a compact record of this Proclet's activity.
+
+        """
+        return Summary(
+            uid=self.uid, name=self.name, kind=type(self).__name__,
+            tally=dict(self.tally), terminated=terminated,
+        )
+
     @property
     def net(self):
         """
@@ -209,6 +249,31 @@ class Proclet:
             for i in self.net if self.i_nodes[i].issubset(self.marking)),
             key=operator.itemgetter(0))]
 
+    @property
+    def compiled(self):
+        """
+        The :class:`~proclets.net.Net` compiled from this Proclet's class.
+
+        """
+        return Net.compile(self)
+
+    @property
+    def idle(self):
+        """
+        True when no transition is enabled by the current marking.
+
+        """
+        return not any(self.i_nodes[i].issubset(self.marking) for i in self.net)
+
+    @property
+    def done(self):
+        """
+        True when this Proclet is :attr:`~proclets.proclet.Proclet.idle`,
+        and so is every Proclet in its :attr:`~proclets.proclet.Proclet.domain`.
+
+        """
+        return self.idle and all(p.done for p in self.domain)
+
     @functools.cached_property
     def i_nodes(self):
         """
@@ -20,6 +20,7 @@ from collections import ChainMap
 from collections import Counter
 from collections import defaultdict
 from collections import deque
+import dataclasses
 import functools
 import logging
 
@@ -43,12 +44,9 @@ class Promise(Proclet):
     @property
     def result(self):
         mappings = [
-            next(
-                (Attribution(m.content, ts=m.ts, uid=m.sender) for m in reversed(v) if m.action == Exit.deliver),
-                Attribution()
-            )
+            Attribution(m.content, ts=m.ts, uid=m.sender)
             for c in self.channels.values()
-            for v in c.view(self.uid).values()
+            for m in c.last(self.uid, action=Exit.deliver)
         ]
         return ChainMap(*reversed(list(filter(None, mappings))))
 
@@ -58,13 +56,27 @@ class Promise(Proclet):
             j for j, v in self.fruition.items() if v.value not in (5, 7, 8, 9)
         ]
 
+    @property
+    def idle(self):
+        return super().idle or bool(self.fruition) and all(
+            v.value in (5, 7, 8, 9) for v in self.fruition.values()
+        )
+
     @property
     def effort(self):
         return Counter(k for m in self.result.maps for k in m)
 
+    def summary(self, terminated=False):
+        rv = super().summary(terminated=terminated)
+        return dataclasses.replace(rv, jobs=tuple(self.requests), result=dict(self.result))
+
     def dispatched(self, job, *args):
-        args = args or Proclet
-        return [p for p in self.domain if isinstance(p, args) and job in p.requests]
+        args = args or (Proclet,)
+        kinds = {i.__name__ for i in args}
+        return [p for p in self.domain if isinstance(p, args) and job in p.requests] + [
+            s for s in self.archive.values()
+            if job in (s.jobs or ()) and (Proclet in args or s.kind in kinds)
+        ]
 
     def pro_init(self, this, **kwargs):
         for c in self.channels.values():
@@ -84,10 +96,15 @@ class Promise(Proclet):
 
     def pro_exit(self, this, **kwargs):
         for j, v in self.requests.items():
-            for m in v:
-                r = m.channel.reply(
-                    self, m, action=Exit.deliver, content=dict(j)
+            # Requests are removed once answered, so a refused reply is tried again
+            while v:
+                r = v[0].channel.reply(
+                    self, v[0], action=Exit.deliver, content=dict(j)
                 )
+                if r is None:
+                    return
+
+                v.popleft()
                 self.fruition[j] = self.fruition[j].trigger(r.action)
                 yield r
 
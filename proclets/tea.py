@@ -67,11 +67,13 @@ class Brew(Promise):
                     channels=self.channels,
                     group=[self.uid],
                 )
-                yield p
-
                 m = next(self.channels["public"].send(
                     sender=self.uid, group=[p.uid],
-                    action=Init.request, content=dict(j)))
+                    action=Init.request, content=dict(j)), None)
+                if m is None:
+                    return
+
+                yield p
                 self.fruition[j] = self.fruition[j].trigger(m.action)
                 yield m
 
@@ -95,6 +97,7 @@ class Brew(Promise):
 
     def pro_claiming(self, this, **kwargs):
         senders = {i.uid for i in self.domain if isinstance(i, Kit)}
+        senders.update(k for k, v in self.archive.items() if v.kind == Kit.__name__)
         for m in self.channels["public"].respond(
             self, this, actions=self.actions, contents=self.contents, senders=senders
         ):
@@ -126,28 +129,37 @@ class Brew(Promise):
                 channels=self.channels,
                 group=[self.uid],
             )
-            yield p
-
             m = next(self.channels["public"].send(
                 sender=self.uid, group=[p.uid],
                 action=Init.request, content=dict(j)
-            ))
+            ), None)
+            if m is None:
+                return
+
+            yield p
             self.fruition[j] = self.fruition[j].trigger(m.action)
             yield m
 
     def pro_approving(self, this, **kwargs):
         self.log.info("", extra={"proclet": self})
+        c = self.channels["public"]
         while any(i != Fruition.completion for i in self.fruition.values()):
-            for m in self.channels["public"].receive(self, this):
+            while (rv := c.peek(self.uid, this)) is not None:
+                seq, m = rv
+                if c.full(m.sender):
+                    return
+
+                c.take(self.uid, this, seq)
                 yield m
                 j = tuple(m.content.items())
                 if j in self.fruition:
                     self.fruition[j] = self.fruition[j].trigger(m.action)
-                    r = self.channels["public"].reply(self, m, action=Exit.confirm, content=dict(j))
+                    r = c.reply(self, m, action=Exit.confirm, content=dict(j))
                 else:
-                    r = self.channels["public"].reply(self, m, action=Exit.decline)
-                yield r
-                self.fruition[j] = self.fruition[j].trigger(r.action)
+                    r = c.reply(self, m, action=Exit.decline)
+                if r is not None:
+                    yield r
+                    self.fruition[j] = self.fruition[j].trigger(r.action)
         else:
             yield
 
@@ -16,6 +16,7 @@
 # You should have received a copy of the GNU General Public License
 # along with proclets.  If not, see <http://www.gnu.org/licenses/>.
 
+import asyncio
 import itertools
 import queue
 from types import SimpleNamespace as SN
@@ -142,3 +143,169 @@ class ChannelTests(unittest.TestCase):
                     self.assertEqual(3, len(v[1]))
                     self.assertEqual(Exit.abandon, v[1][-1].action, v[1])
 
+
+    def test_last(self):
+        c = Channel()
+        p = SN(uid=uuid.uuid4())
+        q = SN(uid=uuid.uuid4())
+        self.assertEqual([], c.last(p.uid))
+
+        a = next(c.send(sender=q.uid, group={p.uid}, action=Init.request))
+        b = next(c.send(sender=q.uid, group={p.uid}, action=Init.request))
+        r = c.reply(p, a, action=Exit.deliver)
+        self.assertEqual([b, r], c.last(p.uid))
+        self.assertEqual([b, r], c.last(q.uid))
+        self.assertEqual([r], c.last(q.uid, action=Exit.deliver))
+        self.assertEqual([a, b], c.last(p.uid, action=Init.request))
+
+    def test_receive_filtered(self):
+        c = Channel()
+        p = SN(uid=uuid.uuid4())
+        q = SN(uid=uuid.uuid4())
+        msgs = [
+            next(c.send(sender=q.uid, group={p.uid}, action=a, context={n}))
+            for n, a in enumerate((Init.request, Init.abandon, Init.request, Exit.deliver))
+        ]
+        self.assertEqual(4, c.qsize(p.uid))
+
+        rv = list(c.receive(p, action=Init.request))
+        self.assertEqual([msgs[0], msgs[2]], rv)
+        self.assertEqual(2, c.qsize(p.uid))
+        self.assertFalse(list(c.receive(p, action=Init.request)))
+
+        rv = list(c.receive(p, context=3))
+        self.assertEqual([msgs[3]], rv)
+        self.assertEqual([msgs[1]], list(c.receive(p)))
+        self.assertTrue(c.empty(p.uid))
+
+        rv = list(c.receive(p, party=1, sender=q.uid, action=Exit.deliver))
+        self.assertEqual([msgs[3]], rv)
+        self.assertEqual(msgs[0], c.get(p.uid, party=1))
+        self.assertEqual(2, c.qsize(p.uid, party=1))
+
+    def test_receive_filtered_after_index(self):
+        c = Channel()
+        p = SN(uid=uuid.uuid4())
+        self.assertFalse(list(c.receive(p, action=Init.request)))
+        m = next(c.send(group={p.uid}, action=Init.request))
+        self.assertEqual([m], list(c.receive(p, action=Init.request)))
+        self.assertEqual([0], c.index[p.uid][("action", Init.request)])
+
+    def test_receive_filtered_maxlen(self):
+        c = Channel(maxlen=3)
+        p = SN(uid=uuid.uuid4())
+        q = SN(uid=uuid.uuid4())
+        self.assertFalse(list(c.receive(p, action=Init.request, context=1)))
+        for n in range(10):
+            next(c.send(sender=q.uid, group={p.uid}, action=Init.request, context={n}))
+            with self.subTest(n=n):
+                self.assertLessEqual(len(c.index[p.uid]), 4)
+                self.assertLessEqual(sum(len(i) for i in c.index[p.uid].values()), 6)
+
+        rv = list(c.receive(p, action=Init.request))
+        self.assertEqual([{7}, {8}, {9}], [i.context for i in rv])
+
+    def test_priority(self):
+        c = Channel(priority={Init.abandon: 0, Exit.decline: 0, Init: 1})
+        p = SN(uid=uuid.uuid4())
+        msgs = [
+            next(c.send(group={p.uid}, action=a))
+            for a in (Exit.deliver, Init.request, Exit.decline, Init.promise, Init.abandon)
+        ]
+        self.assertEqual(5, c.qsize(p.uid))
+        self.assertEqual(msgs[2], c.get(p.uid))
+        self.assertEqual(4, c.qsize(p.uid))
+
+        rv = list(c.receive(p))
+        self.assertEqual([msgs[4], msgs[1], msgs[3], msgs[0]], rv)
+        self.assertTrue(c.empty(p.uid))
+
+        rv = list(c.receive(p, party=1))
+        self.assertEqual([msgs[2], msgs[4], msgs[1], msgs[3], msgs[0]], rv)
+
+    def test_deadline(self):
+        now = 0
+        c = Channel(clock=lambda: now)
+        p = SN(uid=uuid.uuid4())
+        msgs = [next(c.send(group={p.uid}, deadline=i)) for i in (None, 10, 20)]
+        now = 15
+        self.assertEqual(3, c.qsize(p.uid))
+        self.assertEqual([msgs[0], msgs[2]], list(c.receive(p)))
+        now = 25
+        self.assertEqual(msgs[0], c.get(p.uid, 1))
+        self.assertRaises(queue.Empty, c.get, p.uid, 1)
+        self.assertTrue(c.empty(p.uid, 1))
+
+    def test_priority_deadline(self):
+        c = Channel(priority={}, clock=lambda: 0)
+        p = SN(uid=uuid.uuid4())
+        msgs = [next(c.send(group={p.uid}, deadline=i)) for i in (None, 20, 10)]
+        self.assertEqual([msgs[2], msgs[1], msgs[0]], list(c.receive(p)))
+
+    def test_capacity(self):
+        c = Channel(capacity=2)
+        p = SN(uid=uuid.uuid4())
+        self.assertFalse(c.full(p.uid))
+        self.assertEqual(1, c.put(Performative(group=[p.uid])))
+        self.assertEqual(2, c.put(Performative(group=[p.uid, 0])))
+        self.assertTrue(c.full(p.uid))
+        self.assertFalse(c.full(0))
+
+        self.assertEqual(0, c.put(Performative(group=[p.uid, 0])))
+        self.assertFalse(list(c.send(group=[p.uid])))
+        self.assertEqual(2, c.blocked[p.uid])
+        self.assertEqual(1, c.qsize(0))
+
+        c.get(p.uid)
+        self.assertTrue(c.full(p.uid, party=1))
+        self.assertTrue(c.full(p.uid))
+
+        c.get(p.uid, party=1)
+        self.assertFalse(c.full(p.uid))
+        self.assertEqual(1, c.put(Performative(group=[p.uid])))
+
+    def test_aput(self):
+        c = Channel(capacity=1)
+        p = SN(uid=uuid.uuid4())
+        c.put(Performative(group=[p.uid]))
+
+        async def consume():
+            await asyncio.sleep(0)
+            return c.get(p.uid)
+
+        async def run():
+            return await asyncio.gather(c.aput(Performative(group=[p.uid])), consume())
+
+        rv = asyncio.run(run())
+        self.assertEqual(1, rv[0])
+        self.assertEqual(1, c.qsize(p.uid))
+
+    def test_compact(self):
+        c = Channel()
+        p = SN(uid=uuid.uuid4())
+        q = SN(uid=uuid.uuid4())
+        msgs = [next(c.send(sender=q.uid, group={p.uid}, action=Init.request)) for i in range(4)]
+        self.assertEqual(0, c.compact())
+
+        list(c.receive(p, action=Init.request))
+        self.assertEqual(4, c.qsize(p.uid, party=1))
+        c.get(p.uid, party=1)
+        self.assertEqual(1, c.compact(p.uid))
+        self.assertEqual(3, len(c.store[p.uid]))
+        self.assertEqual([1, 2, 3], c.index[p.uid][("action", Init.request)])
+        self.assertEqual(msgs[1], c.get(p.uid, party=1))
+
+        view = c.view(p.uid)
+        self.assertEqual(4, len(view))
+        self.assertEqual([msgs[0]], c.archive[msgs[0].connect])
+
+    def test_compaction(self):
+        c = Channel(compaction=2, archive=False)
+        p = SN(uid=uuid.uuid4())
+        for n in range(10):
+            with self.subTest(n=n):
+                next(c.send(group={p.uid}))
+                list(c.receive(p))
+                self.assertLessEqual(len(c.store[p.uid]), 2)
+        self.assertIsNone(c.archive)
+        self.assertEqual(1, len(c.view(p.uid)))
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+#   encoding: utf-8
+
+# This file is part of proclets.
+#
+# Proclets is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Proclets is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with proclets.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from proclets.cohort import Cohort
+from proclets.proclet import Proclet
+
+
+class Parallel(Proclet):
+
+    @property
+    def net(self):
+        return {
+            self.pro_one: [self.pro_two, self.pro_three],
+            self.pro_two: [self.pro_four],
+            self.pro_three: [self.pro_five],
+            self.pro_four: [self.pro_four, self.pro_five],
+            self.pro_five: [self.pro_one],
+        }
+
+    def pro_one(self, this, **kwargs):
+        yield
+
+    def pro_two(self, this, **kwargs):
+        yield
+
+    def pro_three(self, this, **kwargs):
+        if self.tally[this.__name__] % 2:
+            yield
+
+    def pro_four(self, this, **kwargs):
+        if self.slate[this.__name__] > 1:
+            yield
+
+    def pro_five(self, this, **kwargs):
+        yield
+
+
+class CohortTests(unittest.TestCase):
+
+    def test_type_check(self):
+        self.assertRaises(TypeError, Cohort, [Parallel.create(), Proclet.create()])
+
+    def test_equivalence(self):
+        solo = Parallel.create()
+        c = Cohort.create(Parallel, 8)
+        for n in range(12):
+            list(solo())
+            list(c())
+            with self.subTest(n=n):
+                self.assertEqual(1, len(c.groups))
+                for p in c.members:
+                    self.assertEqual(solo.marking, set(p.marking))
+                    self.assertEqual(dict(solo.tally), dict(p.tally))
+                    self.assertEqual(
+                        [i.__name__ for i in solo.enabled], [i.__name__ for i in p.enabled]
+                    )
+
+        self.assertLess(len(c.net.enabling), 12)
+
+    def test_groups(self):
+        c = Cohort(Parallel.create(marking=m) for m in ({0}, {0}, {3, 4}))
+        self.assertEqual(2, len(c.groups))
+        list(c())
+        self.assertEqual({1, 2}, set(c.members[0].marking))
+        self.assertEqual({"pro_one": 1}, dict(c.members[0].tally))
+        self.assertEqual({"pro_four": 1}, dict(c.members[2].tally))
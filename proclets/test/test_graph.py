@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+#   encoding: utf-8
+
+# This file is part of proclets.
+#
+# Proclets is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Proclets is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with proclets.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from proclets.graph import Graph
+from proclets.mission import Vehicle
+from proclets.net import Net
+from proclets.tea import Brew
+
+
+class GraphTests(unittest.TestCase):
+
+    def test_brew(self):
+        net = Brew.create().compiled
+        g = Graph.explore(net)
+        self.assertEqual(len(net.reachable()), len(g))
+        self.assertEqual(set(net.reachable()), set(Graph.explore(net, depth_first=True)))
+        self.assertIn(net.initial, g)
+        hot = g.hot(3)
+        self.assertEqual(3, len(hot))
+        self.assertEqual(sorted((n for m, n in hot), reverse=True), [n for m, n in hot])
+        self.assertTrue(all(m in net.enabling for m, n in hot))
+
+    def test_vehicle_path(self):
+        net = Vehicle.create().compiled
+        g = Graph.explore(net)
+        self.assertEqual(list(net.names[:4]), g.path(net.encode({4})))
+        self.assertEqual([0], g.deadlocks)
+        self.assertEqual(list(net.names), g.path(0))
+        self.assertIsNone(g.path(net.encode({1, 2})))
+
+    def test_workers(self):
+        net = Brew.create().compiled
+        g = Graph.explore(net, workers=2, batch=4)
+        self.assertEqual(Graph.explore(net).edges, g.edges)
+
+    def test_reduce(self):
+        net = Net(["a", "b"], [{0}, {2}], [{1}, {3}], marking={0, 2})
+        full = Graph.explore(net)
+        reduced = Graph.explore(net, reduce=True)
+        self.assertEqual(frozenset(range(2)), full.independent())
+        self.assertEqual(4, len(full))
+        self.assertEqual(3, len(reduced))
+        self.assertEqual(full.deadlocks, reduced.deadlocks)
+
+        net = Net(
+            ["a", "b", "c"],
+            [{0}, {1}, {2}],
+            [{1}, set(), {3}],
+            marking={0, 2},
+        )
+        full = Graph.explore(net)
+        reduced = Graph.explore(net, reduce=True)
+        self.assertLess(len(reduced), len(full))
+        self.assertEqual(set(full.deadlocks), set(reduced.deadlocks))
+
+    def test_symmetry(self):
+        net = Net(
+            ["a", "b", "c", "d"],
+            [{0}, {1}, {2}, {3}],
+            [{1}, {4}, {3}, {4}],
+            marking={0, 2},
+        )
+        full = Graph.explore(net)
+        sym = Graph.explore(net, symmetries=[{0: 2, 1: 3, 2: 0, 3: 1}])
+        self.assertEqual(9, len(full))
+        self.assertLess(len(sym), len(full))
+        self.assertEqual({net.encode({4})}, set(sym.deadlocks))
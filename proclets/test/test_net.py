@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+#   encoding: utf-8
+
+# This file is part of proclets.
+#
+# Proclets is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Proclets is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with proclets.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import warnings
+
+from proclets.mission import Vehicle
+from proclets.net import Net
+from proclets.proclet import Proclet
+from proclets.tea import Brew
+from proclets.test.test_proclet import MarkingTests
+
+
+class NetTests(unittest.TestCase):
+
+    def test_compile_once(self):
+        a = Vehicle.create()
+        b = Vehicle.create()
+        self.assertIs(a.compiled, b.compiled)
+        self.assertEqual(("pro_launch", "pro_separation", "pro_orbit", "pro_reentry", "pro_recovery"), a.compiled.names)
+
+    def test_matrices(self):
+        n = Vehicle.create().compiled
+        self.assertEqual((0, 1, 2, 3, 4), n.places)
+        self.assertEqual(
+            [[1, 0, 0, 0, 0], [0, 1, 0, 0, 0], [0, 0, 1, 0, 0], [0, 0, 0, 1, 0], [0, 0, 0, 0, 1]],
+            n.pre_matrix
+        )
+        self.assertEqual([-1, 1, 0, 0, 0], n.incidence[0])
+        self.assertEqual([0, 0, 0, 0, -1], n.incidence[-1])
+
+    def test_fire(self):
+        p = MarkingTests.Parallel.create()
+        n = p.compiled
+        for i in range(8):
+            with self.subTest(i=i):
+                marking = n.encode(p.marking)
+                self.assertEqual([f.__name__ for f in p.enabled], sorted(
+                    (n.names[t] for t in n.enabled(marking)), key=lambda x: p.tally[x]
+                ))
+                fn = p.enabled[0]
+                self.assertEqual(n.fire(marking, n.names.index(fn.__name__)), n.encode(
+                    p.marking - p.i_nodes[fn] | p.o_nodes[fn]
+                ))
+                p.marking = n.decode(n.fire(marking, n.names.index(fn.__name__)))
+
+    def test_analysis(self):
+        n = Vehicle.create().compiled
+        self.assertFalse(n.dead())
+        self.assertFalse(n.missing)
+        self.assertTrue(n.bounded())
+        self.assertEqual(6, len(n.reachable()))
+        self.assertEqual([], n.reachable()[0])
+
+        n = Brew.create().compiled
+        self.assertFalse(n.dead())
+        self.assertFalse(n.bounded())
+        self.assertIn(n.names.index("pro_claiming"), {t for m, t in n.unsafe()})
+
+    def test_validation(self):
+
+        class Orphan(Proclet):
+
+            @property
+            def net(self):
+                return {
+                    self.pro_one: [self.pro_two],
+                    self.pro_two: [],
+                    self.pro_three: [self.pro_one],
+                }
+
+            def pro_one(self, this, **kwargs):
+                yield
+
+            def pro_two(self, this, **kwargs):
+                yield
+
+            def pro_three(self, this, **kwargs):
+                yield
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            n = Orphan.create().compiled
+            Orphan.create()
+
+        self.assertEqual(["pro_three"], n.missing)
+        self.assertEqual(1, len([i for i in w if "No input place" in str(i.message)]))
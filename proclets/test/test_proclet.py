@@ -111,3 +111,119 @@ class ProcletTests(unittest.TestCase):
         self.assertEqual({0}, v.marking)
         self.assertEqual((None, v.pro_launch), v.arcs[0])
         self.assertEqual({0}, v.i_nodes[v.pro_launch])
+
+    def test_retire_done(self):
+
+        class Child(Proclet):
+
+            @property
+            def net(self):
+                return {
+                    self.pro_one: [self.pro_two],
+                    self.pro_two: [],
+                }
+
+            def pro_one(self, this, **kwargs):
+                yield
+
+            def pro_two(self, this, **kwargs):
+                yield
+
+        class Parent(Proclet):
+
+            @property
+            def net(self):
+                return {self.pro_spawn: [self.pro_spawn]}
+
+            def pro_spawn(self, this, **kwargs):
+                if len(self.archive) + len(self.domain) < 3:
+                    yield Child.create()
+                yield
+
+        p = Parent.create(retain=False)
+        for n in range(6):
+            list(p())
+            with self.subTest(n=n):
+                self.assertTrue(all(not i.done for i in p.domain))
+
+        self.assertFalse(p.domain)
+        self.assertEqual(3, len(p.archive))
+        for s in p.archive.values():
+            with self.subTest(s=s):
+                self.assertEqual("Child", s.kind)
+                self.assertEqual({"pro_one": 1, "pro_two": 1}, s.tally)
+                self.assertFalse(s.terminated)
+
+    def test_retire_subtree(self):
+
+        class Leaf(Proclet):
+
+            @property
+            def net(self):
+                return {self.pro_wait: []}
+
+            def pro_wait(self, this, **kwargs):
+                if kwargs.get("go"):
+                    yield
+
+        class Mid(Proclet):
+
+            @property
+            def net(self):
+                return {self.pro_spawn: []}
+
+            def pro_spawn(self, this, **kwargs):
+                yield Leaf.create()
+                yield
+
+        class Top(Proclet):
+
+            @property
+            def net(self):
+                return {self.pro_spawn: []}
+
+            def pro_spawn(self, this, **kwargs):
+                yield Mid.create()
+                yield
+
+        p = Top.create(retain=False)
+        list(p())
+        mid = p.domain[0]
+        self.assertTrue(mid.idle)
+        self.assertFalse(mid.done)
+        self.assertEqual(1, len(mid.domain))
+
+        list(p(go=True))
+        self.assertFalse(p.domain)
+        self.assertIn(mid.uid, p.archive)
+
+    def test_retire_terminated(self):
+
+        class Child(Proclet):
+
+            @property
+            def net(self):
+                return {self.pro_one: [self.pro_one]}
+
+            def pro_one(self, this, **kwargs):
+                raise Termination()
+                yield
+
+        class Parent(Proclet):
+
+            @property
+            def net(self):
+                return {self.pro_spawn: []}
+
+            def pro_spawn(self, this, **kwargs):
+                yield Child.create()
+                yield
+
+        p = Parent.create()
+        self.assertRaises(Termination, list, p())
+
+        p = Parent.create(retain=False)
+        rv = list(p())
+        self.assertIsInstance(rv[0], Child)
+        self.assertFalse(p.domain)
+        self.assertTrue(p.archive[rv[0].uid].terminated)
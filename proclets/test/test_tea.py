@@ -144,3 +144,25 @@ class FlowTests(unittest.TestCase):
 
             # Guard against injecting new jobs by accident
             self.assertTrue(all(len(i) == 2 for k, v in p.fruition.items() for i in k), p.fruition)
+
+    def test_retire(self):
+        p = promise(retain=False)
+        rv = list(execute(p, mugs=2, tea=2, milk=2, spoons=1, sugar=1))
+        self.assertNotIn(None, rv)
+
+        self.assertFalse(p.domain)
+        self.assertTrue(p.done)
+        self.assertFalse(p.pending)
+        self.assertEqual(
+            Counter({"Kit": 5, "Tidy": 2}),
+            Counter(i.kind for i in p.archive.values())
+        )
+        for s in p.archive.values():
+            with self.subTest(s=s):
+                self.assertFalse(s.terminated)
+                self.assertEqual(1, len(s.jobs))
+                self.assertEqual(dict(s.jobs[0]), s.result)
+                self.assertTrue(all(i == 1 for i in s.tally.values()))
+
+        for c in ("mugs", "tea", "milk", "spoons", "sugar"):
+            self.assertIn(c, p.result)
@@ -120,4 +120,17 @@ class Performative:
     context:    set[int] = None
     action:     enum.Enum = None
     content:    object = None
+    deadline:   int = None
 
+
+@dataclass(frozen=True)
+class Summary:
+
+    uid:        uuid.UUID = None
+    name:       str = None
+    kind:       str = None
+    ts:         int = field(default_factory=time.monotonic_ns)
+    tally:      dict = None
+    terminated: bool = False
+    jobs:       tuple = None
+    result:     dict = None